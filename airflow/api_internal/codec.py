@@ -0,0 +1,62 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Encoding of Internal API request and response bodies, shared by the client and the server."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None  # type: ignore[assignment]
+
+JSON_CONTENT_TYPE = "application/json"
+MSGPACK_CONTENT_TYPE = "application/msgpack"
+
+JSON_HEADERS = {"Content-Type": JSON_CONTENT_TYPE}
+MSGPACK_HEADERS = {"Content-Type": MSGPACK_CONTENT_TYPE}
+
+
+def is_msgpack_available() -> bool:
+    """Return whether the ``msgpack`` package needed to encode MessagePack bodies is installed."""
+    return msgpack is not None
+
+
+def get_headers(use_msgpack: bool) -> dict[str, str]:
+    """Return the HTTP headers describing a body encoded with :func:`encode`."""
+    return MSGPACK_HEADERS if use_msgpack else JSON_HEADERS
+
+
+def encode(obj: Any, use_msgpack: bool) -> bytes:
+    """
+    Encode a request or response body.
+
+    JSON is produced with the standard library so that both sides agree on non-finite floats and big ints.
+    MessagePack requires the optional ``msgpack`` package, see :func:`is_msgpack_available`.
+    """
+    if use_msgpack:
+        return msgpack.packb(obj, use_bin_type=True)
+    return json.dumps(obj).encode()
+
+
+def decode(data: bytes, use_msgpack: bool) -> Any:
+    """Decode a body produced by :func:`encode`."""
+    if use_msgpack:
+        return msgpack.unpackb(data, raw=False)
+    return json.loads(data)
@@ -18,13 +18,13 @@
 from __future__ import annotations
 
 import functools
-import json
 import logging
 from typing import TYPE_CHECKING, Any, Callable
 from uuid import uuid4
 
-from flask import Response
+from flask import Response, request
 
+from airflow.api_internal import codec
 from airflow.jobs.job import Job, most_recent_job
 from airflow.models.taskinstance import _record_task_map_for_downstreams
 from airflow.models.xcom_arg import _get_task_map_length
@@ -136,12 +136,50 @@ def log_and_build_error_response(message, status):
     return Response(response=client_message, status=status)
 
 
-def internal_airflow_api(body: dict[str, Any]) -> APIResponse:
+def _decode_request(use_msgpack: bool) -> Any:
+    """
+    Decode the request body with the codec matching its Content-Type.
+
+    The endpoints accept both JSON and MessagePack, so connexion does not validate the body against the
+    JSON schema and it has to be checked by the handlers. The handlers therefore take no ``body`` argument
+    and read the raw request data instead.
+    """
+    return codec.decode(request.get_data(), use_msgpack)
+
+
+def _validate_envelope(body: Any) -> str | None:
+    """Return an error message if ``body`` is not a well-formed JSON-RPC request, else None."""
+    if not isinstance(body, dict) or body.get("jsonrpc") != "2.0":
+        return "Expected jsonrpc 2.0 request."
+    if not isinstance(body.get("method"), str):
+        return "Expected method name to be a string."
+    params = body.get("params")
+    if params is not None and not isinstance(params, dict):
+        return "Expected params to be an object."
+    return None
+
+
+def _build_response(output_json: Any, use_msgpack: bool) -> Response:
+    response = codec.encode(output_json, use_msgpack) if output_json is not None else None
+    return Response(response=response, headers=codec.get_headers(use_msgpack))
+
+
+def internal_airflow_api() -> APIResponse:
     """Handle Internal API /internal_api/v1/rpcapi endpoint."""
     log.debug("Got request")
-    json_rpc = body.get("jsonrpc")
-    if json_rpc != "2.0":
-        return log_and_build_error_response(message="Expected jsonrpc 2.0 request.", status=400)
+    use_msgpack = request.mimetype == codec.MSGPACK_CONTENT_TYPE
+    if use_msgpack and not codec.is_msgpack_available():
+        return log_and_build_error_response(
+            message="MessagePack is not supported, msgpack is not installed on the Internal API server.",
+            status=415,
+        )
+    try:
+        body = _decode_request(use_msgpack)
+    except Exception:
+        return log_and_build_error_response(message="Error decoding request body.", status=400)
+    error = _validate_envelope(body)
+    if error:
+        return log_and_build_error_response(message=error, status=400)
 
     methods_map = _initialize_map()
     method_name = body.get("method")
@@ -156,6 +194,8 @@ def internal_airflow_api(body: dict[str, Any]) -> APIResponse:
             params = BaseSerialization.deserialize(params_json, use_pydantic_models=True)
     except Exception:
         return log_and_build_error_response(message="Error deserializing parameters.", status=400)
+    if not isinstance(params, dict):
+        return log_and_build_error_response(message="Expected parameters to be a dict.", status=400)
 
     log.debug("Calling method %s\nparams: %s", method_name, params)
     try:
@@ -163,7 +203,6 @@ def internal_airflow_api(body: dict[str, Any]) -> APIResponse:
         with create_session() as session:
             output = handler(**params, session=session)
             output_json = BaseSerialization.serialize(output, use_pydantic_models=True)
-            response = json.dumps(output_json) if output_json is not None else None
-            return Response(response=response, headers={"Content-Type": "application/json"})
+            return _build_response(output_json, use_msgpack)
     except Exception:
         return log_and_build_error_response(message=f"Error executing method '{method_name}'.", status=500)
@@ -18,15 +18,17 @@
 from __future__ import annotations
 
 import inspect
-import json
 import logging
-from functools import wraps
-from typing import Callable, TypeVar
+import os
+import time
+from functools import lru_cache, wraps
+from typing import Any, Callable, TypeVar
 
 import requests
-import tenacity
+from requests.adapters import HTTPAdapter
 from urllib3.exceptions import NewConnectionError
 
+from airflow.api_internal import codec
 from airflow.configuration import conf
 from airflow.exceptions import AirflowConfigException, AirflowException
 from airflow.settings import _ENABLE_AIP_44
@@ -38,13 +40,30 @@ RT = TypeVar("RT")
 logger = logging.getLogger(__name__)
 
 
+@lru_cache
+def _get_session() -> requests.Session:
+    """Return the HTTP session shared by all Internal API calls, so connections are kept alive."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Pooled connections must not be shared between a parent and a forked child process.
+os.register_at_fork(after_in_child=_get_session.cache_clear)
+
+# Internal API configuration managed by InternalApiConfig. It is kept in module globals rather than class
+# attributes so that internal_api_call wrappers can read it with a single global lookup.
+# _USE_INTERNAL_API is None until the configuration is initialized.
+_USE_INTERNAL_API: bool | None = None
+_INTERNAL_API_ENDPOINT = ""
+_USE_MSGPACK = False
+
+
 class InternalApiConfig:
     """Stores and caches configuration for Internal API."""
 
-    _initialized = False
-    _use_internal_api = False
-    _internal_api_endpoint = ""
-
     @staticmethod
     def force_database_direct_access():
         """
@@ -53,36 +72,77 @@ class InternalApiConfig:
         All methods decorated with internal_api_call will always be executed locally.
         This mode is needed for "trusted" components like Scheduler, Webserver or Internal Api server.
         """
-        InternalApiConfig._initialized = True
-        InternalApiConfig._use_internal_api = False
+        global _USE_INTERNAL_API
+        _USE_INTERNAL_API = False
 
     @staticmethod
     def get_use_internal_api():
-        if not InternalApiConfig._initialized:
+        if _USE_INTERNAL_API is None:
             InternalApiConfig._init_values()
-        return InternalApiConfig._use_internal_api
+        return _USE_INTERNAL_API
 
     @staticmethod
     def get_internal_api_endpoint():
-        if not InternalApiConfig._initialized:
+        if _USE_INTERNAL_API is None:
             InternalApiConfig._init_values()
-        return InternalApiConfig._internal_api_endpoint
+        return _INTERNAL_API_ENDPOINT
 
     @staticmethod
     def _init_values():
+        global _USE_INTERNAL_API, _INTERNAL_API_ENDPOINT, _USE_MSGPACK
         use_internal_api = conf.getboolean("core", "database_access_isolation", fallback=False)
         if use_internal_api and not _ENABLE_AIP_44:
             raise RuntimeError("The AIP_44 is not enabled so you cannot use it.")
         internal_api_endpoint = ""
+        use_msgpack = False
         if use_internal_api:
             internal_api_url = conf.get("core", "internal_api_url")
             internal_api_endpoint = internal_api_url + "/internal_api/v1/rpcapi"
             if not internal_api_endpoint.startswith("http://"):
                 raise AirflowConfigException("[core]internal_api_url must start with http://")
-
-        InternalApiConfig._initialized = True
-        InternalApiConfig._use_internal_api = use_internal_api
-        InternalApiConfig._internal_api_endpoint = internal_api_endpoint
+            use_msgpack = conf.getboolean("core", "internal_api_msgpack", fallback=False)
+            if use_msgpack and not codec.is_msgpack_available():
+                raise AirflowConfigException(
+                    "[core]internal_api_msgpack requires the msgpack package, "
+                    "install it with `pip install 'apache-airflow[msgpack]'`"
+                )
+
+        _INTERNAL_API_ENDPOINT = internal_api_endpoint
+        _USE_MSGPACK = use_msgpack
+        _USE_INTERNAL_API = use_internal_api
+
+
+_MAX_ATTEMPTS = 10
+
+
+def _post_jsonrpc(url: str, data: dict[str, Any]) -> bytes:
+    # Only called from internal_api_call wrappers once InternalApiConfig is initialized.
+    payload, headers = codec.encode(data, _USE_MSGPACK), codec.get_headers(_USE_MSGPACK)
+    # Retry connection errors with exponential backoff (1s, 2s, 4s, ...). This is done inline rather
+    # than with tenacity to keep the successful call, which is by far the most common one, cheap.
+    for attempt in range(1, _MAX_ATTEMPTS + 1):
+        try:
+            response = _get_session().post(url=url, data=payload, headers=headers)
+            break
+        except (NewConnectionError, requests.exceptions.ConnectionError) as e:
+            if attempt == _MAX_ATTEMPTS:
+                raise
+            wait = 2 ** (attempt - 1)
+            logger.warning(
+                "Internal API request to %s failed to connect (attempt %s of %s), retrying in %ss: %s",
+                url,
+                attempt,
+                _MAX_ATTEMPTS,
+                wait,
+                e,
+            )
+            time.sleep(wait)
+    if response.status_code != 200:
+        raise AirflowException(
+            f"Got {response.status_code}:{response.reason} when sending "
+            f"the internal api request: {response.text}"
+        )
+    return response.content
 
 
 def internal_api_call(func: Callable[PS, RT]) -> Callable[PS, RT]:
@@ -98,48 +158,57 @@ def internal_api_call(func: Callable[PS, RT]) -> Callable[PS, RT]:
     See [AIP-44](https://cwiki.apache.org/confluence/display/AIRFLOW/AIP-44+Airflow+Internal+API)
     for more information .
     """
-    headers = {
-        "Content-Type": "application/json",
+    # Unwrap decorators such as provide_session to get at the real parameter names.
+    unwrapped = inspect.unwrap(func)
+    code = unwrapped.__code__
+    positional_names = code.co_varnames[: code.co_argcount]
+    parameter_names = code.co_varnames[: code.co_argcount + code.co_kwonlyargcount]
+    # Mirror the checks of Signature.bind, so that bad calls fail on the client rather than on the server.
+    positional_defaults = unwrapped.__defaults__ or ()
+    keyword_only_defaults = unwrapped.__kwdefaults__ or {}
+    required_names = frozenset(positional_names[: len(positional_names) - len(positional_defaults)]) | {
+        name for name in parameter_names[code.co_argcount :] if name not in keyword_only_defaults
     }
-    from requests.exceptions import ConnectionError
-
-    @tenacity.retry(
-        stop=tenacity.stop_after_attempt(10),
-        wait=tenacity.wait_exponential(min=1),
-        retry=tenacity.retry_if_exception_type((NewConnectionError, ConnectionError)),
-        before_sleep=tenacity.before_log(logger, logging.WARNING),
-    )
+    accepted_keyword_names = None if code.co_flags & inspect.CO_VARKEYWORDS else frozenset(parameter_names)
+    has_session = "session" in parameter_names
+    has_cls = "cls" in parameter_names
+    method_name = f"{func.__module__}.{func.__qualname__}"
+
     def make_jsonrpc_request(method_name: str, params_json: str) -> bytes:
         data = {"jsonrpc": "2.0", "method": method_name, "params": params_json}
-        internal_api_endpoint = InternalApiConfig.get_internal_api_endpoint()
-        response = requests.post(url=internal_api_endpoint, data=json.dumps(data), headers=headers)
-        if response.status_code != 200:
-            raise AirflowException(
-                f"Got {response.status_code}:{response.reason} when sending "
-                f"the internal api request: {response.text}"
-            )
-        return response.content
+        return _post_jsonrpc(_INTERNAL_API_ENDPOINT, data)
 
     @wraps(func)
     def wrapper(*args, **kwargs):
-        use_internal_api = InternalApiConfig.get_use_internal_api()
-        if not use_internal_api:
+        if _USE_INTERNAL_API is None:
+            InternalApiConfig._init_values()
+        if not _USE_INTERNAL_API:
             return func(*args, **kwargs)
 
         from airflow.serialization.serialized_objects import BaseSerialization  # avoid circular import
 
-        bound = inspect.signature(func).bind(*args, **kwargs)
-        arguments_dict = dict(bound.arguments)
-        if "session" in arguments_dict:
-            del arguments_dict["session"]
-        if "cls" in arguments_dict:  # used by @classmethod
-            del arguments_dict["cls"]
+        if len(args) > len(positional_names):
+            raise TypeError(f"{method_name}() got too many positional arguments")
+        arguments_dict = dict(zip(positional_names, args))
+        if not arguments_dict.keys().isdisjoint(kwargs):
+            duplicates = sorted(arguments_dict.keys() & kwargs.keys())
+            raise TypeError(f"{method_name}() got multiple values for arguments {duplicates}")
+        if accepted_keyword_names is not None and not accepted_keyword_names.issuperset(kwargs):
+            unexpected = sorted(kwargs.keys() - accepted_keyword_names)
+            raise TypeError(f"{method_name}() got unexpected keyword arguments {unexpected}")
+        arguments_dict.update(kwargs)
+        if not required_names.issubset(arguments_dict):
+            missing = sorted(required_names - arguments_dict.keys())
+            raise TypeError(f"{method_name}() missing required arguments {missing}")
+        if has_session:
+            arguments_dict.pop("session", None)
+        if has_cls:  # used by @classmethod
+            arguments_dict.pop("cls", None)
 
         args_dict = BaseSerialization.serialize(arguments_dict, use_pydantic_models=True)
-        method_name = f"{func.__module__}.{func.__qualname__}"
         result = make_jsonrpc_request(method_name, args_dict)
         if result is None or result == b"":
             return None
-        return BaseSerialization.deserialize(json.loads(result), use_pydantic_models=True)
+        return BaseSerialization.deserialize(codec.decode(result, _USE_MSGPACK), use_pydantic_models=True)
 
     return wrapper
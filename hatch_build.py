@@ -104,6 +104,9 @@ CORE_EXTRAS: dict[str, list[str]] = {
     "leveldb": [
         "plyvel",
     ],
+    "msgpack": [
+        "msgpack>=1.0.0",
+    ],
     "otel": [
         "opentelemetry-exporter-prometheus",
     ],